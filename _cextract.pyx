@@ -0,0 +1,46 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+C implementation of extractor.extract().
+
+Walks the same compiled (kind, name, var) steps with the same explicit stack,
+but reads dicts and lists through the CPython C API. extractor.py falls back to
+its pure-Python extract() when this extension is not built.
+"""
+from cpython.dict cimport PyDict_GetItem
+from cpython.list cimport PyList_GET_ITEM, PyList_GET_SIZE
+from cpython.ref cimport PyObject
+
+# Must match extractor.PLAIN; tests/test_cextract.py checks that it does.
+PLAIN = 0
+
+
+def extract(data, tuple steps, coords_trail, key):
+    cdef int plain = PLAIN
+    cdef Py_ssize_t n_steps = len(steps)
+    cdef Py_ssize_t pos, idx
+    cdef list stack = [(data, 0, coords_trail)]
+    cdef tuple entry, step
+    cdef PyObject* found
+
+    while stack:
+        entry = stack.pop()
+        node, pos, trail = entry
+        while pos < n_steps:
+            step = <tuple>steps[pos]
+            kind, name, var = step
+            pos += 1
+            if kind == plain:
+                if not isinstance(node, dict):
+                    break
+                found = PyDict_GetItem(node, name)
+                if found is NULL:
+                    break
+                node = <object>found
+            else:
+                segment = node.get(name, []) if name else node
+                if isinstance(segment, list):
+                    for idx in range(PyList_GET_SIZE(segment) - 1, -1, -1):
+                        stack.append((<object>PyList_GET_ITEM(segment, idx), pos, (trail, var, idx)))
+                break
+        else:
+            yield key, node, trail
@@ -1,76 +1,228 @@
-import re
+import sys
 from collections import defaultdict
-from typing import Any, Dict, List, Tuple
-from .utils import group_paths_by_root, extract_operations, apply_filters, apply_sorting
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from .utils import apply_filters, apply_sorting, parse_operation, path_root
 from .joiner import join_multiple_datasets
 
-__all__ = ["extract_json_paths", "parse_paths_and_operations"]
+try:
+    from ._cextract import extract as _extract_c
+except ImportError:  # extension not built; use the pure-Python extract()
+    _extract_c = None
+
+__all__ = ["extract_json_paths", "extract_json_paths_iter", "parse_paths_and_operations"]
 RESERVED_KEYS = {"join_by", "sort_by", "filter_by", "group_by"}
 
 def parse_path(path: str) -> Tuple[List[str], str]:
     if ' as ' in path:
         raw_path, alias = path.split(' as ')
-        return raw_path.strip().split('.'), alias.strip()
+        return raw_path.strip().split('.'), sys.intern(alias.strip())
     parts = path.strip().split('.')
-    return parts, parts[-1]
+    return parts, sys.intern(parts[-1])
 
 
-def extract(data: Any, components: List[str], coords: Dict[str, int], key: str, results: List[Dict]):
-    if not components:
-        results.append({'value': data, 'coords': coords.copy(), 'key': key})
-        return
+def split_segment(head: str) -> Optional[Tuple[Optional[str], Optional[str], Optional[str]]]:
+    """
+    Split an iterator segment like "items{i}" or "*" into (prefix, var, suffix).
+
+    Returns None for a plain key. Equivalent to a full match of
+    r'(.*)?(?:\{(\w+)\}|\*)(.*)?': the last `{var}` or `*` marker wins.
+    """
+    star = head.rfind('*')
+    i = head.rfind('{')
+    while i > star:
+        j = head.find('}', i + 1)
+        var = head[i + 1:j]
+        if j != -1 and var.replace('_', 'a').isalnum():
+            return head[:i] or None, sys.intern(var), head[j + 1:] or None
+        i = head.rfind('{', 0, i)
+    if star != -1:
+        return head[:star] or None, None, head[star + 1:] or None
+    return None
+
+
+# Compiled path steps are (kind, name, var) tuples. PLAIN steps look up `name`
+# in a dict; ITER steps iterate the list at `name` (or the current node when
+# name is None), binding each index to `var`.
+PLAIN = 0
+ITER = 1
+Step = Tuple[int, Optional[str], Optional[str]]
 
-    head, *tail = components
-    match = re.fullmatch(r'(.*)?(?:\{(\w+)\}|\*)(.*)?', head)
 
-    if match:
-        prefix, var, suffix = match.groups()
+@lru_cache(maxsize=256)
+def _compile_path(path: str) -> Tuple[Tuple[Step, ...], str]:
+    """
+    Parse a path once into steps that extract() can dispatch on directly.
+
+    A `*` is named `_anon_N` here, N being the number of distinct iterator
+    vars bound before it, and a suffix after an iterator becomes its own step.
+    """
+    components, key = parse_path(path)
+    steps = []
+    bound_vars = set()
+    pending = components[::-1]
+    while pending:
+        head = pending.pop()
+        match = split_segment(head) if '{' in head or '*' in head else None
+        if match is None:
+            steps.append((PLAIN, head, None))
+            continue
+        prefix, var, suffix = match
         if var is None:
-            var = f'_anon_{len(coords)}'
-        segment = data
-        if prefix:
-            segment = segment.get(prefix, [])
+            var = sys.intern(f'_anon_{len(bound_vars)}')
+        bound_vars.add(var)
+        steps.append((ITER, prefix, var))
         if suffix:
-            tail = [suffix] + tail
-        if isinstance(segment, list):
-            for idx, item in enumerate(segment):
-                new_coords = coords.copy()
-                new_coords[var] = idx
-                extract(item, tail, new_coords, key, results)
-    elif isinstance(data, dict) and head in data:
-        extract(data[head], tail, coords, key, results)
+            pending.append(suffix)
+    return tuple(steps), key
+
+
+# Iterator coordinates are threaded through extract() as an immutable linked
+# trail of (parent, var, idx) nodes, so siblings share their common prefix
+# instead of each copying a coords dict.
+CoordsTrail = Optional[Tuple[Any, str, int]]
+
+
+def trail_to_coords(trail: CoordsTrail) -> Dict[str, int]:
+    coords = {}
+    while trail is not None:
+        trail, var, idx = trail
+        coords.setdefault(var, idx)  # innermost binding wins, as with dict updates
+    return coords
 
 
-def join_values_by_scope(extracted: List[Dict]) -> List[Dict]:
+def extract(data: Any, steps: Tuple[Step, ...], coords_trail: CoordsTrail,
+            key: str) -> Iterator[Tuple[str, Any, CoordsTrail]]:
+    # Depth-first walk over an explicit stack of (node, step index, trail);
+    # plain steps are followed inline, list children are pushed in reverse so
+    # leaves come out in document order.
+    n_steps = len(steps)
+    stack = [(data, 0, coords_trail)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        node, pos, trail = pop()
+        while pos < n_steps:
+            kind, name, var = steps[pos]
+            pos += 1
+            if kind == PLAIN:
+                if not (isinstance(node, dict) and name in node):
+                    break
+                node = node[name]
+            else:
+                segment = node.get(name, []) if name else node
+                if isinstance(segment, list):
+                    for idx in range(len(segment) - 1, -1, -1):
+                        push((segment[idx], pos, (trail, var, idx)))
+                break
+        else:
+            yield key, node, trail
+
+
+def _no_shared_coords(coords: Dict[str, int]) -> Tuple:
+    return ()
+
+
+def group_leaves(extracted: Iterable[Tuple[str, Any, CoordsTrail]]) -> Dict[str, List[Tuple[Any, CoordsTrail]]]:
     grouped_by_key = defaultdict(list)
-    for item in extracted:
-        grouped_by_key[item['key']].append(item)
+    for key, value, trail in extracted:
+        grouped_by_key[key].append((value, trail))
+    return grouped_by_key
+
 
-    def depth(item): return len(item['coords'])
-    base_items = max(grouped_by_key.values(), key=lambda group: max(depth(i) for i in group))
+def join_values_by_scope(extracted: Iterable[Tuple[str, Any, CoordsTrail]]) -> Iterator[Dict]:
+    # Leaves are bucketed as they are produced; records are then yielded lazily.
+    yield from scope_records(group_leaves(extracted))
 
-    results = []
-    for base in base_items:
-        base_coords = base['coords']
-        record = {base['key']: base['value']}
+
+def scope_records(grouped_by_key: Dict[str, List[Tuple[Any, CoordsTrail]]]) -> Iterator[Dict]:
+    # A single key (one queried branch) has nothing to match against.
+    if len(grouped_by_key) == 1:
         for key, items in grouped_by_key.items():
-            if key == base['key']:
-                continue
-            for item in items:
-                if all(base_coords.get(k) == item['coords'].get(k) for k in base_coords.keys() & item['coords'].keys()):
-                    record[key] = item['value']
-                    break
-        results.append(record)
-    return results
+            for value, _ in items:
+                yield {key: value}
+        return
 
+    # Materialize coords and note each group's deepest item in the same pass;
+    # the deepest group drives the join.
+    group_max_depth = {}
+    for key, items in grouped_by_key.items():
+        max_depth = 0
+        for i, (value, trail) in enumerate(items):
+            coords = trail_to_coords(trail)
+            items[i] = (value, coords)
+            depth = len(coords)
+            if depth > max_depth:
+                max_depth = depth
+        group_max_depth[key] = max_depth
+    base_key = max(group_max_depth, key=group_max_depth.get)
+    base_items = grouped_by_key[base_key]
 
-def extract_json_paths(data: Dict, paths: List[str]) -> List[Dict]:
+    # Index every other key's items on the coord vars they share with the base,
+    # so matching is a dict probe per base rather than a scan of the group.
+    # Items of one key normally share a single coord-var set, but aliases
+    # reused across paths may not, so indexes are kept per distinct var set.
+    var_sets = {
+        key: list(dict.fromkeys(frozenset(coords) for _, coords in items))
+        for key, items in grouped_by_key.items()
+    }
+    other_keys = [key for key in grouped_by_key if key != base_key]
+    probes = {}
+    probes_get = probes.get
+
+    def build_probes(base_vars, key):
+        # One (shared-coords getter, index) pair per coord-var set of `key`;
+        # the intersection with the base's vars is taken here, not per
+        # candidate. The same itemgetter builds index keys and probe keys.
+        entry = []
+        for item_vars in var_sets[key]:
+            names = tuple(item_vars & base_vars)
+            get_shared = itemgetter(*names) if names else _no_shared_coords
+            index = {}
+            index_setdefault = index.setdefault
+            for pos, (value, coords) in enumerate(grouped_by_key[key]):
+                if coords.keys() == item_vars:
+                    index_setdefault(get_shared(coords), (pos, value))
+            entry.append((get_shared, index))
+        return entry
+
+    for base_value, base_coords in base_items:
+        base_vars = frozenset(base_coords)
+        record = {base_key: base_value}
+        for key in other_keys:
+            entry = probes_get((base_vars, key))
+            if entry is None:
+                entry = probes[(base_vars, key)] = build_probes(base_vars, key)
+            found = None
+            for get_shared, index in entry:
+                hit = index.get(get_shared(base_coords))
+                if hit is not None and (found is None or hit[0] < found[0]):
+                    found = hit
+            if found is not None:
+                record[key] = found[1]
+        yield record
+
+
+_extract = _extract_c or extract
+
+
+def _extract_leaves(data: Dict, compiled_paths: List[Tuple[Tuple[Step, ...], str]]) -> Iterator[Tuple[str, Any, CoordsTrail]]:
+    return chain.from_iterable(_extract(data, steps, None, key) for steps, key in compiled_paths)
+
+
+def _extract_parsed(data: Dict, compiled_paths: List[Tuple[Tuple[Step, ...], str]]) -> Iterator[Dict]:
+    return join_values_by_scope(_extract_leaves(data, compiled_paths))
+
+
+def extract_json_paths_iter(data: Dict, paths: List[str]) -> Iterator[Dict]:
     data_paths, _ = parse_paths_and_operations(paths)
-    all_extracted = []
-    for path in data_paths:
-        components, key = parse_path(path)
-        extract(data, components, {}, key, all_extracted)
-    return join_values_by_scope(all_extracted)
+    return _extract_parsed(data, [_compile_path(path) for path in data_paths])
+
+
+def extract_json_paths(data: Dict, paths: List[str]) -> List[Dict]:
+    return list(extract_json_paths_iter(data, paths))
 
 
 def parse_paths_and_operations(paths: List[str]) -> Tuple[List[str], Dict[str, List[str]]]:
@@ -90,6 +242,42 @@ def parse_paths_and_operations(paths: List[str]) -> Tuple[List[str], Dict[str, L
     return data_paths, dict(operations)
 
 
+@dataclass(frozen=True)
+class _Plan:
+    operations: Dict[str, List[str]]
+    components_per_group: List[List[Tuple[Tuple[Step, ...], str]]]
+
+
+def _parse_all(paths: Iterable[str]) -> Tuple[Dict[str, List[str]], List[List[Tuple[Tuple[Step, ...], str]]]]:
+    """
+    Classify, group and compile every path expression in a single pass.
+
+    Anything containing ':' is an operation like "sort_by: [score DESC]".
+    Other paths are grouped by path_root() and compiled with _compile_path().
+    """
+    operations = defaultdict(list)
+    compiled_groups = defaultdict(list)
+
+    for path in paths:
+        operation = parse_operation(path)
+        if operation is not None:
+            operations[operation[0]].extend(operation[1])
+        else:
+            path = path.strip()
+            compiled_groups[path_root(path)].append(_compile_path(path))
+
+    return dict(operations), list(compiled_groups.values())
+
+
+@lru_cache(maxsize=256)
+def _plan(paths_tuple: Tuple[str, ...]) -> _Plan:
+    """
+    Build (and memoize) the query plan for a tuple of path expressions.
+
+    The returned plan is shared between calls and must be treated as read-only.
+    """
+    return _Plan(*_parse_all(paths_tuple))
+
 
 def get_data_from_path(data, paths, yield_mode=False):
     """
@@ -105,23 +293,32 @@ def get_data_from_path(data, paths, yield_mode=False):
     Returns:
         Union[List[dict], Generator[dict]]: Output rows, as list or generator.
     """
-    pure_paths = [p for p in paths if ':' not in p]
-    operations = extract_operations(paths)
-
-    path_groups = group_paths_by_root(pure_paths)
-    extracted_datasets = [
-        extract_json_paths(data, group_paths)
-        for group_paths in path_groups.values()
-    ]
+    plan = _plan(tuple(paths))
+    operations = plan.operations
 
+    # Every stage below is lazy; rows are only materialized by sorting or by
+    # the final list() when yield_mode is off.
     if 'join_by' in operations:
+        # The join streams its largest input and indexes the rest, so it needs
+        # a size per group. The scope join buffers a group's leaves anyway, so
+        # group them up front and use the largest key's leaf count, an upper
+        # bound on the group's rows, as the hint.
+        datasets, size_hints = [], []
+        for compiled_paths in plan.components_per_group:
+            grouped = group_leaves(_extract_leaves(data, compiled_paths))
+            size_hints.append(max(map(len, grouped.values()), default=0))
+            datasets.append(scope_records(grouped))
         result_iter = join_multiple_datasets(
-            datasets=extracted_datasets,
+            datasets=datasets,
             on=operations['join_by'],
-            yield_mode=yield_mode
+            yield_mode=True,
+            size_hints=size_hints
         )
     else:
-        result_iter = (row for dataset in extracted_datasets for row in dataset)
+        result_iter = chain.from_iterable(
+            _extract_parsed(data, compiled_paths)
+            for compiled_paths in plan.components_per_group
+        )
 
     if 'filter_by' in operations:
         result_iter = apply_filters(result_iter, operations['filter_by'])
@@ -129,5 +326,7 @@ def get_data_from_path(data, paths, yield_mode=False):
     if 'sort_by' in operations:
         result_iter = apply_sorting(result_iter, operations['sort_by'])
 
-    return result_iter if yield_mode else list(result_iter)
+    if yield_mode or isinstance(result_iter, list):
+        return result_iter
+    return list(result_iter)
 
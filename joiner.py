@@ -1,9 +1,11 @@
-from typing import List, Dict, Any, Iterable, Union
+from collections import defaultdict
+from typing import List, Dict, Any, Iterable, Optional, Union
 
 def join_multiple_datasets(
     datasets: Union[List[List[Dict[str, Any]]], Iterable[List[Dict[str, Any]]]],
     on: List[str],
-    yield_mode: bool = False
+    yield_mode: bool = False,
+    size_hints: Optional[List[float]] = None
 ) -> Union[List[Dict[str, Any]], Iterable[Dict[str, Any]]]:
     """
     Perform a full outer join across multiple datasets using specified join keys.
@@ -12,31 +14,62 @@ def join_multiple_datasets(
         datasets: List (or iterable) of datasets, each a list of dicts.
         on: List of field names to join on.
         yield_mode: If True, yields results one-by-one as a generator.
+        size_hints: Optional row count (or estimate) per dataset, used instead
+            of len() to pick which dataset is streamed rather than indexed.
 
     Returns:
         List or generator of joined dict rows.
     """
 
+    datasets = list(datasets)
+
+    # Single-field joins (the common case) key on the raw value, skipping
+    # the per-row tuple and generator allocation.
+    single = len(on) == 1
+    on0 = on[0] if single else None
+
+    # Index every dataset except the largest one, which is streamed against
+    # the indexes instead. Without a hint, inputs lacking a length are assumed
+    # to be the largest, so an iterator can be probed without being materialized.
+    if size_hints is None:
+        size_hints = [len(d) if hasattr(d, '__len__') else float('inf') for d in datasets]
+    probe_pos = size_hints.index(max(size_hints)) if datasets else None
+
     indexes = []
-    for dataset in datasets:
-        index = {}
+    for pos, dataset in enumerate(datasets):
+        if pos == probe_pos:
+            indexes.append(None)
+            continue
+        index = defaultdict(list)
         for item in dataset:
-            key = tuple(item.get(k) for k in on)
-            if None in key:
-                continue  
-            index.setdefault(key, []).append(item)
+            key = item.get(on0) if single else tuple(item.get(k) for k in on)
+            if (key is None if single else None in key):
+                continue
+            index[key].append(item)
         indexes.append(index)
 
-    all_keys = set()
-    for index in indexes:
-        all_keys.update(index.keys())
+    def combine(key, probe_item):
+        combined = {}
+        for index in indexes:
+            combined.update(probe_item if index is None else index.get(key, [{}])[0])
+        return combined
 
     def generate_joins():
-        for key in all_keys:
-            combined = {}
-            for index in indexes:
-                match = index.get(key, [{}])[0]
-                combined.update(match)
-            yield combined
+        seen = set()
+        seen_add = seen.add
+        if probe_pos is not None:
+            for item in datasets[probe_pos]:
+                key = item.get(on0) if single else tuple(item.get(k) for k in on)
+                if (key is None if single else None in key) or key in seen:
+                    continue
+                seen_add(key)
+                yield combine(key, item)
+        for index in indexes:
+            if index is None:
+                continue
+            for key in index:
+                if key not in seen:
+                    seen_add(key)
+                    yield combine(key, {})
 
     return generate_joins() if yield_mode else list(generate_joins())
@@ -1,10 +1,48 @@
-from setuptools import setup, find_packages
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # without Cython, extractor.py uses its pure-Python extract()
+    cythonize = None
+
+
+class optional_build_ext(build_ext):
+    """Build the C extractor when possible; a failed compile falls back to pure Python."""
+
+    def run(self):
+        try:
+            super().run()
+        except PlatformError as exc:
+            self._skip(exc)
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, ExecError, PlatformError) as exc:
+            self._skip(exc)
+
+    def _skip(self, exc):
+        self.warn(f"could not build the C extractor ({exc}); using the pure-Python extract()")
+
+
+ext_modules = []
+if cythonize:
+    ext_modules = cythonize(
+        [Extension("jsonweave._cextract", ["_cextract.pyx"])],
+        compiler_directives={"language_level": 3},
+    )
 
 setup(
     name="jsonweave",                    
     version="0.1.0",                     
-    packages=find_packages(),            
+    packages=["jsonweave"],
+    package_dir={"jsonweave": "."},
     install_requires=[],                 
+    extras_require={"numpy": ["numpy"]},
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": optional_build_ext},
     author="Shubham Chauhan",
     author_email="shubhamsc9504@gmail.com",
     description="jsonweave is a lightweight, high-performance Python library for extracting and transforming deeply nested JSON using a declarative, flat syntax. It allows developers to traverse complex structures, join disparate branches, and manipulate datasets with minimal boilerplate.",
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from jsonweave import extractor
+
+_cextract = pytest.importorskip("jsonweave._cextract")
+
+
+def random_json(rnd, depth=0):
+    if depth > 3 or (depth and rnd.random() < 0.2):
+        return rnd.choice([0, 1, "x", None, [], {}])
+    if rnd.random() < 0.5:
+        return [random_json(rnd, depth + 1) for _ in range(rnd.randint(1, 3))]
+    return {rnd.choice("abc"): random_json(rnd, depth + 1) for _ in range(rnd.randint(1, 3))}
+
+
+def random_path(rnd, data):
+    # Mostly follow the shape of `data` so that paths reach real leaves.
+    segments = []
+    for var in "ijkl":
+        if isinstance(data, list) and data and rnd.random() < 0.9:
+            segments.append(rnd.choice([f"{{{var}}}", "*"]))
+            data = rnd.choice(data)
+        elif isinstance(data, dict) and data and rnd.random() < 0.9:
+            key = rnd.choice(list(data))
+            if isinstance(data[key], list) and rnd.random() < 0.3:
+                segments.append(f"{key}{{{var}}}")
+                data = rnd.choice(data[key] or [None])
+            else:
+                segments.append(key)
+                data = data[key]
+        else:
+            segments.append(rnd.choice(["a", "{i}", "*"]))
+            break
+    return ".".join(segments) + " as v"
+
+
+def test_plain_tag_matches():
+    assert _cextract.PLAIN == extractor.PLAIN
+
+
+def test_matches_python_extract():
+    rnd = random.Random(0)
+    for _ in range(3000):
+        data = random_json(rnd)
+        steps, key = extractor._compile_path(random_path(rnd, data))
+        try:
+            expected = list(extractor.extract(data, steps, None, key))
+        except AttributeError:
+            # a named iterator over a non-dict raises in both implementations
+            with pytest.raises(AttributeError):
+                list(_cextract.extract(data, steps, None, key))
+            continue
+        assert list(_cextract.extract(data, steps, None, key)) == expected
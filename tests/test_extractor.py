@@ -0,0 +1,63 @@
+import pytest
+
+from jsonweave import extractor
+from jsonweave.extractor import extract_json_paths, get_data_from_path
+
+
+def test_nested_scopes_repeat_outer_values():
+    data = {"classes": [
+        {"name": "A", "students": [{"n": "x"}, {"n": "y"}]},
+        {"name": "B", "students": [{"n": "z"}]},
+    ]}
+    paths = ["classes.{i}.name as cls", "classes.{i}.students.{j}.n as student"]
+
+    assert extract_json_paths(data, paths) == [
+        {"cls": "A", "student": "x"},
+        {"cls": "A", "student": "y"},
+        {"cls": "B", "student": "z"},
+    ]
+
+
+def test_alias_reused_across_var_sets():
+    data = {"a": [{"v": 1}, {"v": 2}], "b": [{"w": [10, 20]}, {"w": [30]}]}
+    paths = ["a.{i}.v as x", "b.{i}.w.{j} as x"]
+
+    assert extract_json_paths(data, paths) == [{"x": 1}, {"x": 2}, {"x": 10}, {"x": 20}, {"x": 30}]
+
+
+def test_wildcards_are_numbered_per_path():
+    steps, key = extractor._compile_path("rows.*.*")
+    assert key == "*"
+    assert [var for _, _, var in steps] == [None, "_anon_0", "_anon_1"]
+
+    # "tags.*" binds _anon_0 too, so it lines up with the outer "rows" index.
+    data = {"rows": [[1, 2], [3]], "tags": ["p", "q"]}
+    paths = ["rows.*.* as cell", "tags.* as tag"]
+
+    assert extract_json_paths(data, paths) == [
+        {"cell": 1, "tag": "p"},
+        {"cell": 2, "tag": "p"},
+        {"cell": 3, "tag": "q"},
+    ]
+
+
+def test_suffix_after_iterator():
+    data = {"a": [{"b": 1}, {"b": 2}, {"c": 3}]}
+
+    assert extract_json_paths(data, ["a{i}b"]) == [{"a{i}b": 1}, {"a{i}b": 2}]
+    assert extract_json_paths(data, ["a.{i}.b as val"]) == [{"val": 1}, {"val": 2}]
+
+
+@pytest.mark.parametrize("yield_mode", [False, True])
+def test_sort_without_filter(yield_mode):
+    # Sorting used to assume filter_by had already turned the rows into a list.
+    data = {"s": [{"n": "a", "v": 2}, {"n": "b", "v": 3}, {"n": "c", "v": 1}]}
+    paths = ["s.{i}.n as name", "s.{i}.v as score", "sort_by: [score DESC]"]
+
+    rows = get_data_from_path(data, paths, yield_mode=yield_mode)
+
+    assert list(rows) == [
+        {"name": "b", "score": 3},
+        {"name": "a", "score": 2},
+        {"name": "c", "score": 1},
+    ]
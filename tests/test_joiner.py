@@ -0,0 +1,45 @@
+from jsonweave.joiner import join_multiple_datasets
+
+
+def test_keys_only_in_indexed_inputs_come_last():
+    streamed = [{"id": 1, "x": "a"}, {"id": 2, "x": "b"}]
+    indexed = [{"id": 2, "y": "B"}, {"id": 3, "y": "C"}]
+
+    assert join_multiple_datasets([streamed, indexed], on=["id"], size_hints=[2, 1]) == [
+        {"id": 1, "x": "a"},
+        {"id": 2, "x": "b", "y": "B"},
+        {"id": 3, "y": "C"},
+    ]
+
+
+def test_duplicate_keys_keep_the_first_row():
+    streamed = [{"id": 1, "x": "first"}, {"id": 1, "x": "second"}, {"id": 2, "x": "other"}]
+    indexed = [{"id": 1, "y": "first"}, {"id": 1, "y": "second"}]
+
+    assert join_multiple_datasets([streamed, indexed], on=["id"]) == [
+        {"id": 1, "x": "first", "y": "first"},
+        {"id": 2, "x": "other"},
+    ]
+
+
+def test_none_keys_are_skipped():
+    left = [{"id": None, "x": 0}, {"id": 1, "x": 1}, {"x": 2}]
+    right = [{"id": None, "y": 0}, {"id": 1, "y": 1}]
+    assert join_multiple_datasets([left, right], on=["id"]) == [{"id": 1, "x": 1, "y": 1}]
+
+    left = [{"a": 1, "b": None}, {"a": 1, "b": 2}]
+    right = [{"a": 1, "b": None, "y": 0}, {"a": 1, "b": 2, "y": 1}]
+    assert join_multiple_datasets([left, right], on=["a", "b"]) == [{"a": 1, "b": 2, "y": 1}]
+
+
+def test_size_hints_pick_the_streamed_input():
+    left = [{"id": 1}, {"id": 2}]
+    right = [{"id": 2}, {"id": 3}]
+
+    # Without hints the first of the largest inputs is streamed.
+    assert [row["id"] for row in join_multiple_datasets([left, right], on=["id"])] == [1, 2, 3]
+    assert [row["id"] for row in join_multiple_datasets([left, right], on=["id"], size_hints=[1, 5])] == [2, 3, 1]
+
+    # An input without a length is streamed rather than materialized.
+    rows = join_multiple_datasets([left, iter(right)], on=["id"], yield_mode=True)
+    assert [row["id"] for row in rows] == [2, 3, 1]
@@ -1,6 +1,47 @@
 from collections import defaultdict
-from typing import List, Dict, Union, Any
+from functools import lru_cache
+from typing import List, Dict, Union, Any, Iterable, Iterator, Callable, Optional, Tuple
 import operator
+from operator import itemgetter, methodcaller
+
+# Sorts of fewer rows stay on the pure-Python path, where building arrays
+# doesn't pay.
+COLUMNAR_MIN_ROWS = 1024
+_EXACT_FLOAT_LIMIT = 2 ** 53
+
+
+def path_root(path: str) -> str:
+    """
+    Return the root object of a data path (before first iterator `{}`).
+
+    Example:
+    - "data.students.{i}.name" → "data.students"
+    """
+    root = []
+    for part in path.strip().split('.'):
+        if '{' in part or '}' in part:
+            break
+        root.append(part)
+    return '.'.join(root)
+
+
+def parse_operation(path: str) -> Optional[Tuple[str, List[str]]]:
+    """
+    Parse an operation like join_by, filter_by, sort_by into (name, values).
+
+    Returns None for paths without a ':'. Format supported:
+    - "join_by: [field1, field2]"
+    - "filter_by: [score > 80, age < 18]"
+    - "sort_by: [score DESC, name ASC]"
+    - "sort_by: score DESC" (a single unbracketed value)
+    """
+    if ':' not in path:
+        return None
+    key, value = path.split(':', 1)
+    value = value.strip()
+    if value.startswith('[') and value.endswith(']'):
+        return key.strip(), [v.strip() for v in value[1:-1].split(',') if v.strip()]
+    return key.strip(), [value]
 
 
 def group_paths_by_root(paths: List[str]) -> Dict[str, List[str]]:
@@ -14,13 +55,7 @@ def group_paths_by_root(paths: List[str]) -> Dict[str, List[str]]:
     for path in paths:
         if ':' in path:  # skip reserved operations
             continue
-        parts = path.strip().split('.')
-        root = []
-        for part in parts:
-            if '{' in part or '}' in part:
-                break
-            root.append(part)
-        groups['.'.join(root)].append(path)
+        groups[path_root(path)].append(path)
     return groups
 
 
@@ -28,46 +63,111 @@ def extract_operations(paths: List[str]) -> Dict[str, List[str]]:
     """
     Extract reserved operations like join_by, filter_by, sort_by.
 
-    Format supported:
-    - "join_by: [field1, field2]"
-    - "filter_by: [score > 80, age < 18]"
-    - "sort_by: [score DESC, name ASC]"
+    See parse_operation() for the supported formats.
     """
     ops = defaultdict(list)
     for path in paths:
-        if ':' in path:
-            key, value = path.split(':', 1)
-            key = key.strip()
-            value = value.strip()
-            if value.startswith('[') and value.endswith(']'):
-                value = value[1:-1]
-                items = [v.strip() for v in value.split(',') if v.strip()]
-                ops[key].extend(items)
-            else:
-                ops[key].append(value)
+        operation = parse_operation(path)
+        if operation is not None:
+            ops[operation[0]].extend(operation[1])
     return ops
 
 
-def apply_filters(data: List[Dict[str, Any]], filters: List[str]) -> List[Dict[str, Any]]:
+FILTER_OPS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne
+}
+_FILTER_OPS_LONGEST_FIRST = sorted(FILTER_OPS, key=lambda x: -len(x))
+_FILTER_OP_SYMBOLS = {op_fn: op_str for op_str, op_fn in FILTER_OPS.items()}
+
+
+def parse_condition(expr: str):
     """
-    Apply filter conditions like "score > 80", "age <= 18".
+    Split a condition like "score > 80" into (key, operator function, value).
+    """
+    for op_str in _FILTER_OPS_LONGEST_FIRST:  # longest match first
+        if op_str in expr:
+            left, right = expr.split(op_str, 1)
+            return left.strip(), FILTER_OPS[op_str], right.strip()
+    return None, None, None
+
+
+def compile_predicate(conditions: List[tuple]) -> Callable[[Dict[str, Any]], Any]:
     """
-    ops = {
-        '>': operator.gt,
-        '<': operator.lt,
-        '>=': operator.ge,
-        '<=': operator.le,
-        '==': operator.eq,
-        '!=': operator.ne
-    }
-
-    def parse_condition(expr: str):
-        for op_str in sorted(ops.keys(), key=lambda x: -len(x)):  # longest match first
-            if op_str in expr:
-                left, right = expr.split(op_str, 1)
-                return left.strip(), ops[op_str], right.strip()
-        return None, None, None
+    Compile parsed (key, operator function, value) conditions into one lambda.
 
+    The conditions become a single `and` expression, e.g.
+    `lambda item: 'score' in item and item['score'] > 80`. Keys and values
+    are embedded with repr(), so only literals reach the generated source.
+    """
+    clauses = [
+        f"{key!r} in item and item[{key!r}] {_FILTER_OP_SYMBOLS[op_fn]} {value!r}"
+        for key, op_fn, value in conditions
+    ]
+    source = "lambda item: " + (" and ".join(clauses) or "True")
+    return eval(compile(source, '<filter_by>', 'eval'), {})
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """
+    Import NumPy on first use, so importing jsonweave doesn't pay for it.
+
+    Returns None when NumPy isn't installed; it is optional and only used for
+    multi-key sorts on numeric columns.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _numeric_column(np, rows: List[Dict[str, Any]], key: str):
+    """
+    Return the values of `key` as a 1-d int64/float64 array, or None if a row
+    lacks the key or NumPy could not compare the values exactly like Python.
+    """
+    try:
+        column = np.asarray([row[key] for row in rows])
+    except (KeyError, ValueError):
+        return None
+    if column.ndim != 1:
+        return None
+    if column.dtype.kind == 'i':
+        return column
+    if column.dtype.kind == 'f' and not np.isnan(column).any() \
+            and np.abs(column).max() < _EXACT_FLOAT_LIMIT:
+        return column
+    return None
+
+
+def _sort_columnar(np, rows: List[Dict[str, Any]], parsed_keys):
+    columns = []
+    for key, asc in reversed(parsed_keys):  # np.lexsort treats the last key as primary
+        column = _numeric_column(np, rows, key)
+        if column is None:
+            return None
+        if not asc:
+            if column.dtype.kind == 'i' and column.min() == np.iinfo(column.dtype).min:
+                return None
+            column = -column
+        columns.append(column)
+    return [rows[i] for i in np.lexsort(columns).tolist()]
+
+
+def apply_filters(data: Iterable[Dict[str, Any]], filters: List[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Apply filter conditions like "score > 80", "age <= 18".
+
+    All conditions are parsed up front and compiled into a single predicate.
+    Rows are consumed and yielded lazily.
+    """
+    conditions = []
     for condition in filters:
         key, op_fn, value = parse_condition(condition)
         if key is None:
@@ -76,13 +176,19 @@ def apply_filters(data: List[Dict[str, Any]], filters: List[str]) -> List[Dict[s
             value = int(value)
         except ValueError:
             pass
-        data = [item for item in data if key in item and op_fn(item[key], value)]
-    return data
+        conditions.append((key, op_fn, value))
+
+    return filter(compile_predicate(conditions), data)
 
 
-def apply_sorting(data: List[Dict[str, Any]], sort_keys: List[str]) -> List[Dict[str, Any]]:
+def apply_sorting(data: Iterable[Dict[str, Any]], sort_keys: List[str]) -> List[Dict[str, Any]]:
     """
     Sort records by given sort keys (supports ASC/DESC).
+
+    Adjacent keys with the same direction are sorted together in one pass.
+    With NumPy installed, large results sorted on several numeric columns are
+    ordered with a single stable np.lexsort; a single key is faster with
+    list.sort, which avoids building arrays from the rows.
     """
     def parse_sort_key(sort_expr):
         if ' ' in sort_expr:
@@ -90,7 +196,30 @@ def apply_sorting(data: List[Dict[str, Any]], sort_keys: List[str]) -> List[Dict
             return key.strip(), direction.strip().upper() != 'DESC'
         return sort_expr.strip(), True  # default to ascending
 
-    for sort_expr in reversed(sort_keys):  # right to left priority
-        key, asc = parse_sort_key(sort_expr)
-        data.sort(key=lambda x: x.get(key), reverse=not asc)
+    parsed_keys = [parse_sort_key(sort_expr) for sort_expr in sort_keys]
+    runs = []  # [(keys, asc)] in priority order
+    for key, asc in parsed_keys:
+        if runs and runs[-1][1] == asc:
+            runs[-1][0].append(key)
+        else:
+            runs.append(([key], asc))
+
+    if not isinstance(data, list):
+        data = list(data)  # sorting needs the whole result; accept any iterable
+
+    if len(parsed_keys) > 1 and len(data) >= COLUMNAR_MIN_ROWS:
+        np = _numpy()
+        ordered = _sort_columnar(np, data, parsed_keys) if np is not None else None
+        if ordered is not None:
+            return ordered
+
+    for keys, asc in reversed(runs):  # right to left priority
+        try:
+            data.sort(key=itemgetter(*keys), reverse=not asc)
+        except KeyError:
+            # Some rows lack a sort field; sort those as None like dict.get would.
+            if len(keys) == 1:
+                data.sort(key=methodcaller('get', keys[0]), reverse=not asc)
+            else:
+                data.sort(key=lambda x: tuple(x.get(k) for k in keys), reverse=not asc)
     return data